@@ -10,11 +10,11 @@ Copyright (c) 2025 OGCR Consortium
 
 import subprocess
 import sys
-import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 def run_command(command, cwd=None):
-    """Run a command and return success status"""
+    """Run a command and return (success, report lines)"""
     try:
         result = subprocess.run(
             command,
@@ -23,21 +23,19 @@ def run_command(command, cwd=None):
             capture_output=True,
             text=True
         )
-        
-        if result.returncode == 0:
-            print(f"✓ {command}")
-            if result.stdout:
-                print(f"  Output: {result.stdout.strip()}")
-            return True
-        else:
-            print(f"✗ {command}")
-            if result.stderr:
-                print(f"  Error: {result.stderr.strip()}")
-            return False
-            
     except Exception as e:
-        print(f"✗ {command} - Exception: {e}")
-        return False
+        return False, [f"✗ {command} - Exception: {e}"]
+
+    if result.returncode == 0:
+        lines = [f"✓ {command}"]
+        if result.stdout:
+            lines.append(f"  Output: {result.stdout.strip()}")
+        return True, lines
+
+    lines = [f"✗ {command}"]
+    if result.stderr:
+        lines.append(f"  Error: {result.stderr.strip()}")
+    return False, lines
 
 def main():
     """Run all tests"""
@@ -45,54 +43,39 @@ def main():
     print("=" * 50)
     
     base_dir = Path(__file__).parent
+
+    # (title, number of tests covered, command)
+    tasks = [
+        # Test 1 & 2: both pytest suites share one pytest-xdist run (worker
+        # count and distribution are set in pytest.ini). The API tests also
+        # cover that the FastAPI app loads.
+        ("1-2. Running Validation Tools and API Server Tests...", 2,
+         "python -m pytest tests/test_spec_checker.py tests/test_api.py -v"),
+        # Test 3, 4 & 5: one checker process validates the examples and
+        # confirms the invalid document is rejected.
+        ("3-5. Testing Spec Checker CLI, Schema Validation and Error Detection...", 3,
+         "python tools/spec_checker.py --file examples/valid_pdd.json --file examples/valid_mrv.json"
+         " --expect-invalid examples/invalid_pdd.json"),
+    ]
+
     success_count = 0
-    total_count = 0
-    
-    # Test 1: Validation Tools Tests
-    print("\n1. Running Validation Tools Tests...")
-    total_count += 1
-    if run_command("python -m pytest tests/test_spec_checker.py -v", cwd=base_dir):
-        success_count += 1
-    
-    # Test 2: API Server Tests
-    print("\n2. Running API Server Tests...")
-    total_count += 1
-    if run_command("python -m pytest tests/test_api.py -v", cwd=base_dir):
-        success_count += 1
-    
-    # Test 3: Spec Checker CLI Tests
-    print("\n3. Testing Spec Checker CLI...")
-    total_count += 1
-    if run_command("python tools/spec_checker.py --file examples/valid_pdd.json", cwd=base_dir):
-        success_count += 1
-    
-    # Test 4: Schema Validation Tests
-    print("\n4. Testing Schema Validation...")
-    total_count += 1
-    if run_command("python tools/spec_checker.py --file examples/valid_mrv.json", cwd=base_dir):
-        success_count += 1
-    
-    # Test 5: Error Detection Tests
-    print("\n5. Testing Error Detection...")
-    total_count += 1
-    # This should fail (return non-zero), so we invert the logic
-    result = subprocess.run(
-        "python tools/spec_checker.py --file examples/invalid_pdd.json",
-        shell=True,
-        cwd=base_dir,
-        capture_output=True
-    )
-    if result.returncode != 0:  # Should fail for invalid document
-        print("✓ Error detection working correctly")
-        success_count += 1
-    else:
-        print("✗ Error detection not working")
-    
-    # Test 6: FastAPI Server Startup
-    print("\n6. Testing FastAPI Server Startup...")
-    total_count += 1
-    if run_command("python -c 'import sys; sys.path.append(\"server\"); from app.main import app; print(\"FastAPI loaded successfully\")'", cwd=base_dir):
-        success_count += 1
+    total_count = sum(count for _, count, _ in tasks)
+
+    # Every task is a separate interpreter, so run them all at once and
+    # report in completion order.
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = {
+            executor.submit(run_command, command, base_dir): (title, count)
+            for title, count, command in tasks
+        }
+        for future in as_completed(futures):
+            title, count = futures[future]
+            success, lines = future.result()
+            print(f"\n{title}")
+            for line in lines:
+                print(line)
+            if success:
+                success_count += count
     
     # Summary
     print("\n" + "=" * 50)
@@ -107,4 +90,3 @@ def main():
 
 if __name__ == "__main__":
     sys.exit(main())
-
@@ -0,0 +1,34 @@
+"""
+Shared fixtures for the OGCR API tests
+
+License: MIT
+Copyright (c) 2025 OGCR Consortium
+"""
+
+import pytest
+import orjson
+import sys
+import os
+
+# Add the server and tools directories to the path, once for all test modules
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path[:0] = [os.path.join(ROOT, 'server'), os.path.join(ROOT, 'tools')]
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client for the API, started once for the whole session"""
+    # FastAPI and the app are only imported by sessions that use the client
+    from fastapi.testclient import TestClient
+    from app.main import app
+    
+    class OGCRTestClient(TestClient):
+        """TestClient that encodes json= request bodies with orjson"""
+        
+        def request(self, method, url, *, json=None, headers=None, **kwargs):
+            if json is not None:
+                kwargs["content"] = orjson.dumps(json)
+                headers = {**(headers or {}), "Content-Type": "application/json"}
+            return super().request(method, url, headers=headers, **kwargs)
+    
+    with OGCRTestClient(app) as test_client:
+        yield test_client
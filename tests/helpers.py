@@ -0,0 +1,13 @@
+"""
+Helpers shared by the OGCR test modules
+
+License: MIT
+Copyright (c) 2025 OGCR Consortium
+"""
+
+from functools import reduce
+from operator import getitem
+
+def set_field(document, path, value):
+    """Set the nested field at path (a tuple of keys) in document"""
+    reduce(getitem, path[:-1], document)[path[-1]] = value
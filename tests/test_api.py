@@ -7,70 +7,132 @@ Copyright (c) 2025 OGCR Consortium
 
 import pytest
 import json
-from fastapi.testclient import TestClient
+import orjson
 from datetime import datetime
-import sys
-import os
+from secrets import token_hex
 
-# Add the server directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'server'))
-
-from app.main import app
-
-# Create test client
-client = TestClient(app)
+from helpers import set_field
 
 # Test data
-VALID_PDD = {
-    "type": "Feature",
-    "ogcr_version": "0.1.0",
-    "profile": "pdd",
-    "geometry": {
-        "type": "Polygon",
-        "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]
-    },
-    "properties": {
-        "name": "Test Forest Project",
-        "description": "A test afforestation project",
-        "creation_date": "2024-12-07T10:00:00Z",
-        "project_type": "afforestation",
-        "status": "draft",
-        "actor_id": "test-developer"
+def clone_pdd():
+    """Fresh copy of the valid PDD test document, safe to modify"""
+    return {
+        "type": "Feature",
+        "ogcr_version": "0.1.0",
+        "profile": "pdd",
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]
+        },
+        "properties": {
+            "name": "Test Forest Project",
+            "description": "A test afforestation project",
+            "creation_date": "2024-12-07T10:00:00Z",
+            "project_type": "afforestation",
+            "status": "draft",
+            "actor_id": "test-developer"
+        }
     }
-}
-
-VALID_MRV = {
-    "type": "Feature",
-    "ogcr_version": "0.1.0",
-    "profile": "mrv",
-    "geometry": {
-        "type": "Polygon",
-        "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]
-    },
-    "properties": {
-        "project_id": "test-project",
-        "methodology_id": "test-methodology",
-        "start_date": "2024-01-01",
-        "end_date": "2024-12-31",
-        "methodology_data": {
-            "parameters": {},
-            "measurement_devices": [],
-            "sampling_strategy": "Random sampling"
+
+def clone_mrv():
+    """Fresh copy of the valid MRV test document, safe to modify"""
+    return {
+        "type": "Feature",
+        "ogcr_version": "0.1.0",
+        "profile": "mrv",
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]
         },
-        "net_removal_estimate": {
-            "value": 1000.0,
-            "unit": "tCO2e",
-            "basis": "Field measurements"
+        "properties": {
+            "project_id": "test-project",
+            "methodology_id": "test-methodology",
+            "start_date": "2024-01-01",
+            "end_date": "2024-12-31",
+            "methodology_data": {
+                "parameters": {},
+                "measurement_devices": [],
+                "sampling_strategy": "Random sampling"
+            },
+            "net_removal_estimate": {
+                "value": 1000.0,
+                "unit": "tCO2e",
+                "basis": "Field measurements"
+            }
         }
     }
-}
+
+# The valid PDD encoded once, for tests that post it unchanged; tests that
+# modify a document start from a clone
+VALID_PDD_BODY = orjson.dumps(clone_pdd())
 
 MOCK_TOKEN = "Bearer mock-token"
+JSON_HEADERS = {"Content-Type": "application/json", "Authorization": MOCK_TOKEN}
+
+@pytest.fixture(scope="module")
+def approved_project_id():
+    """Id of an approved project, seeded into the store once for the module's tests"""
+    from app.main import PDD_ADAPTER, project_meta, save_project
+    
+    project_id = token_hex(16)
+    document = clone_pdd()
+    document["id"] = project_id
+    document["properties"]["status"] = "approved"
+    
+    project = PDD_ADAPTER.validate_python(document)
+    save_project(project_id, PDD_ADAPTER.dump_json(project), project_meta(project.properties))
+    return project_id
+
+def seed_credit(owner, vintage_year=2024, status="active"):
+    """Put a carbon credit straight into the store and return its id"""
+    from app.main import save_credit
+    
+    credit_id = token_hex(16)
+    save_credit(credit_id, {
+        "token_id": credit_id,
+        "project_id": "test-project",
+        "mrv_id": "test-mrv",
+        "vintage_year": vintage_year,
+        "carbon_amount": 1.0,
+        "status": status,
+        "owner": owner,
+        "serial_number": f"OGCR-{credit_id}",
+        "issuance_date": "2024-12-07T10:00:00"
+    })
+    return credit_id
+
+@pytest.fixture(scope="module")
+def credit_owner():
+    """Owner of a few credits seeded once for the module's tests"""
+    owner = f"0x{token_hex(20)}"
+    seed_credit(owner, 2024, "active")
+    seed_credit(owner, 2024, "retired")
+    seed_credit(owner, 2023, "active")
+    return owner
+
+@pytest.fixture
+def draft_project_id(client):
+    """Id of a new draft project, for tests that change the project"""
+    create_response = client.post(
+        "/projects",
+        content=VALID_PDD_BODY,
+        headers=JSON_HEADERS
+    )
+    return create_response.json()["id"]
+
+class TestAppStartup:
+    """Test the FastAPI application loads"""
+
+    def test_app_imports(self):
+        """Test the app module imports and exposes the API"""
+        from app.main import app
+        
+        assert app.title == "OGCR API"
 
 class TestHealthEndpoint:
     """Test health check endpoint"""
     
-    def test_health_check(self):
+    def test_health_check(self, client):
         """Test health endpoint returns 200"""
         response = client.get("/health")
         assert response.status_code == 200
@@ -80,15 +142,26 @@ class TestHealthEndpoint:
         assert "timestamp" in data
         assert "version" in data
 
+    def test_health_check_first_call_at_clock_start(self, client, monkeypatch):
+        """Test the first health body is encoded even with the monotonic clock under 1s"""
+        from app import main
+        
+        monkeypatch.setattr(main, "_health_body", b"")
+        monkeypatch.setattr(main, "_health_encoded_at", 0.0)
+        monkeypatch.setattr(main, "_monotonic", lambda: 0.5)
+        response = client.get("/health")
+        assert response.status_code == 200
+        assert response.json()["status"] == "healthy"
+
 class TestProjectEndpoints:
     """Test project-related endpoints"""
     
-    def test_create_project_success(self):
+    def test_create_project_success(self, client):
         """Test successful project creation"""
         response = client.post(
             "/projects",
-            json=VALID_PDD,
-            headers={"Authorization": MOCK_TOKEN}
+            content=VALID_PDD_BODY,
+            headers=JSON_HEADERS
         )
         assert response.status_code == 201
         
@@ -100,48 +173,44 @@ class TestProjectEndpoints:
         
         return data["id"]  # Return for use in other tests
     
-    def test_create_project_unauthorized(self):
+    def test_create_project_unauthorized(self, client):
         """Test project creation without authentication"""
-        response = client.post("/projects", json=VALID_PDD)
-        assert response.status_code == 403  # FastAPI returns 403 for missing auth
-    
-    def test_create_project_invalid_data(self):
-        """Test project creation with invalid data"""
-        invalid_pdd = VALID_PDD.copy()
-        invalid_pdd["type"] = "InvalidType"
-        
         response = client.post(
             "/projects",
-            json=invalid_pdd,
-            headers={"Authorization": MOCK_TOKEN}
+            content=VALID_PDD_BODY,
+            headers={"Content-Type": "application/json"}
         )
-        assert response.status_code == 422  # Validation error
+        assert response.status_code == 403  # FastAPI returns 403 for missing auth
     
-    def test_get_project_success(self):
+    def test_get_project_success(self, client, approved_project_id):
         """Test getting project details"""
-        # First create a project
-        create_response = client.post(
-            "/projects",
-            json=VALID_PDD,
-            headers={"Authorization": MOCK_TOKEN}
-        )
-        project_id = create_response.json()["id"]
-        
-        # Then get it
-        response = client.get(f"/projects/{project_id}")
+        response = client.get(f"/projects/{approved_project_id}")
         assert response.status_code == 200
         
         data = response.json()
-        assert data["id"] == project_id
+        assert data["id"] == approved_project_id
         assert data["type"] == "Feature"
         assert data["properties"]["name"] == "Test Forest Project"
     
-    def test_get_project_not_found(self):
+    def test_get_project_not_modified(self, client, approved_project_id):
+        """Test conditional get of project details with If-None-Match"""
+        response = client.get(f"/projects/{approved_project_id}")
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        
+        response = client.get(
+            f"/projects/{approved_project_id}",
+            headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+    
+    def test_get_project_not_found(self, client):
         """Test getting non-existent project"""
         response = client.get("/projects/non-existent")
         assert response.status_code == 404
     
-    def test_list_projects(self):
+    def test_list_projects(self, client):
         """Test listing projects"""
         response = client.get("/projects")
         assert response.status_code == 200
@@ -157,20 +226,20 @@ class TestProjectEndpoints:
         assert "offset" in pagination
         assert "has_more" in pagination
     
-    def test_list_projects_with_filters(self):
+    def test_list_projects_with_filters(self, client):
         """Test listing projects with filters"""
         # Create a draft project
         client.post(
             "/projects",
-            json=VALID_PDD,
-            headers={"Authorization": MOCK_TOKEN},
+            content=VALID_PDD_BODY,
+            headers=JSON_HEADERS,
         )
 
         # Create and submit another project so it doesn't match the filter
         create_response = client.post(
             "/projects",
-            json=VALID_PDD,
-            headers={"Authorization": MOCK_TOKEN},
+            content=VALID_PDD_BODY,
+            headers=JSON_HEADERS,
         )
         submitted_project_id = create_response.json()["id"]
         client.post(
@@ -189,22 +258,40 @@ class TestProjectEndpoints:
         # The submitted project should not be included
         assert submitted_project_id not in [p["id"] for p in data["data"]]
     
-    def test_update_project_success(self):
+    def test_list_projects_cursor_pagination(self, client):
+        """Test walking the project list with next_cursor"""
+        for _ in range(3):
+            client.post(
+                "/projects",
+                content=VALID_PDD_BODY,
+                headers=JSON_HEADERS,
+            )
+
+        response = client.get("/projects?limit=2")
+        assert response.status_code == 200
+        first_page = response.json()
+        assert first_page["pagination"]["has_more"]
+        cursor = first_page["pagination"]["next_cursor"]
+        assert cursor == first_page["data"][-1]["id"]
+
+        response = client.get(f"/projects?limit=2&cursor={cursor}")
+        assert response.status_code == 200
+        second_page = response.json()
+        first_ids = [p["id"] for p in first_page["data"]]
+        assert not any(p["id"] in first_ids for p in second_page["data"])
+
+    def test_list_projects_invalid_cursor(self, client):
+        """Test listing projects with an unknown cursor"""
+        response = client.get("/projects?cursor=non-existent")
+        assert response.status_code == 400
+    
+    def test_update_project_success(self, client, draft_project_id):
         """Test updating a draft project"""
-        # Create a project
-        create_response = client.post(
-            "/projects",
-            json=VALID_PDD,
-            headers={"Authorization": MOCK_TOKEN}
-        )
-        project_id = create_response.json()["id"]
-        
-        # Update it
-        updated_pdd = VALID_PDD.copy()
+        updated_pdd = clone_pdd()
         updated_pdd["properties"]["name"] = "Updated Project Name"
         
         response = client.put(
-            f"/projects/{project_id}",
+            f"/projects/{draft_project_id}",
             json=updated_pdd,
             headers={"Authorization": MOCK_TOKEN}
         )
@@ -212,160 +299,106 @@ class TestProjectEndpoints:
         
         data = response.json()
         assert data["properties"]["name"] == "Updated Project Name"
-    
-    def test_submit_project_success(self):
-        """Test submitting a project"""
-        # Create a project
-        create_response = client.post(
-            "/projects",
-            json=VALID_PDD,
-            headers={"Authorization": MOCK_TOKEN}
-        )
-        project_id = create_response.json()["id"]
-        
-        # Submit it
-        response = client.post(
-            f"/projects/{project_id}/submit",
-            headers={"Authorization": MOCK_TOKEN}
-        )
-        assert response.status_code == 200
-        
-        data = response.json()
-        assert data["status"] == "submitted"
-        assert "blockchain_reference" in data
-        assert "submitted_at" in data
-    
-    def test_approve_project_success(self):
-        """Test approving a submitted project"""
-        # Create and submit a project
-        create_response = client.post(
-            "/projects",
-            json=VALID_PDD,
-            headers={"Authorization": MOCK_TOKEN}
-        )
-        project_id = create_response.json()["id"]
-        
-        client.post(
-            f"/projects/{project_id}/submit",
-            headers={"Authorization": MOCK_TOKEN}
-        )
-        
-        # Approve it
-        approval_data = {"notes": "Project approved"}
-        response = client.post(
-            f"/projects/{project_id}/approve",
-            json=approval_data,
-            headers={"Authorization": MOCK_TOKEN}
-        )
-        assert response.status_code == 200
-        
-        data = response.json()
-        assert data["status"] == "approved"
-        assert "approved_at" in data
-        assert "approved_by" in data
 
 class TestMRVEndpoints:
     """Test MRV-related endpoints"""
     
-    def setup_method(self):
-        """Set up an approved project for MRV tests"""
-        # Create and approve a project
-        create_response = client.post(
-            "/projects",
-            json=VALID_PDD,
-            headers={"Authorization": MOCK_TOKEN}
-        )
-        self.project_id = create_response.json()["id"]
-        
-        client.post(
-            f"/projects/{self.project_id}/submit",
-            headers={"Authorization": MOCK_TOKEN}
-        )
-        
-        client.post(
-            f"/projects/{self.project_id}/approve",
-            json={"notes": "Approved for testing"},
-            headers={"Authorization": MOCK_TOKEN}
-        )
-    
-    def test_create_mrv_report_success(self):
-        """Test creating MRV report"""
-        mrv_data = VALID_MRV.copy()
-        mrv_data["properties"]["project_id"] = self.project_id
-        
-        response = client.post(
-            f"/projects/{self.project_id}/monitoring",
-            json=mrv_data,
-            headers={"Authorization": MOCK_TOKEN}
-        )
-        assert response.status_code == 201
-        
-        data = response.json()
-        assert "id" in data
-        assert data["status"] == "pending_verification"
-        assert "validation_results" in data
-    
-    def test_get_mrv_report_success(self):
+    def test_get_mrv_report_success(self, client, approved_project_id):
         """Test getting MRV report details"""
         # Create MRV report
-        mrv_data = VALID_MRV.copy()
-        mrv_data["properties"]["project_id"] = self.project_id
+        mrv_data = clone_mrv()
+        mrv_data["properties"]["project_id"] = approved_project_id
         
         create_response = client.post(
-            f"/projects/{self.project_id}/monitoring",
+            f"/projects/{approved_project_id}/monitoring",
             json=mrv_data,
             headers={"Authorization": MOCK_TOKEN}
         )
         mrv_id = create_response.json()["id"]
         
         # Get MRV report
-        response = client.get(f"/projects/{self.project_id}/monitoring/{mrv_id}")
+        response = client.get(f"/projects/{approved_project_id}/monitoring/{mrv_id}")
         assert response.status_code == 200
         
         data = response.json()
         assert data["id"] == mrv_id
-        assert data["properties"]["project_id"] == self.project_id
+        assert data["properties"]["project_id"] == approved_project_id
     
-    def test_list_mrv_reports(self):
+    def test_list_mrv_reports(self, client, approved_project_id):
         """Test listing MRV reports for a project"""
-        response = client.get(f"/projects/{self.project_id}/monitoring")
+        response = client.get(f"/projects/{approved_project_id}/monitoring")
         assert response.status_code == 200
         
         data = response.json()
         assert "data" in data
         assert "pagination" in data
+
+class TestProjectLifecycle:
+    """Test a project through submission, approval and MRV verification"""
     
-    def test_verify_mrv_report_success(self):
-        """Test verifying MRV report"""
-        # Create MRV report
-        mrv_data = VALID_MRV.copy()
-        mrv_data["properties"]["project_id"] = self.project_id
-        
-        create_response = client.post(
-            f"/projects/{self.project_id}/monitoring",
-            json=mrv_data,
-            headers={"Authorization": MOCK_TOKEN}
-        )
-        mrv_id = create_response.json()["id"]
-        
-        # Verify it
-        verification_data = {"verified_removals": 950.0}
-        response = client.post(
-            f"/projects/{self.project_id}/monitoring/{mrv_id}/verify",
-            json=verification_data,
-            headers={"Authorization": MOCK_TOKEN}
-        )
-        assert response.status_code == 200
-        
-        data = response.json()
-        assert data["status"] == "verified"
-        assert "verified_at" in data
-        assert "verified_by" in data
+    def test_project_lifecycle(self, client, draft_project_id, subtests):
+        """Test each lifecycle step in turn, sharing one project"""
+        project_id = draft_project_id
+        
+        with subtests.test(msg="submit project"):
+            response = client.post(
+                f"/projects/{project_id}/submit",
+                headers={"Authorization": MOCK_TOKEN}
+            )
+            assert response.status_code == 200
+            
+            data = response.json()
+            assert data["status"] == "submitted"
+            assert "blockchain_reference" in data
+            assert "submitted_at" in data
+        
+        with subtests.test(msg="approve project"):
+            response = client.post(
+                f"/projects/{project_id}/approve",
+                json={"notes": "Project approved"},
+                headers={"Authorization": MOCK_TOKEN}
+            )
+            assert response.status_code == 200
+            
+            data = response.json()
+            assert data["status"] == "approved"
+            assert "approved_at" in data
+            assert "approved_by" in data
+        
+        with subtests.test(msg="create MRV report"):
+            mrv_data = clone_mrv()
+            mrv_data["properties"]["project_id"] = project_id
+            
+            response = client.post(
+                f"/projects/{project_id}/monitoring",
+                json=mrv_data,
+                headers={"Authorization": MOCK_TOKEN}
+            )
+            assert response.status_code == 201
+            
+            data = response.json()
+            assert "id" in data
+            assert data["status"] == "pending_verification"
+            assert "validation_results" in data
+            mrv_id = data["id"]
+        
+        with subtests.test(msg="verify MRV report"):
+            response = client.post(
+                f"/projects/{project_id}/monitoring/{mrv_id}/verify",
+                json={"verified_removals": 950.0},
+                headers={"Authorization": MOCK_TOKEN}
+            )
+            assert response.status_code == 200
+            
+            data = response.json()
+            assert data["status"] == "verified"
+            assert "verified_at" in data
+            assert "verified_by" in data
 
 class TestCreditEndpoints:
     """Test credit-related endpoints"""
     
-    def test_list_credits(self):
+    def test_list_credits(self, client):
         """Test listing credits"""
         response = client.get("/credits")
         assert response.status_code == 200
@@ -374,12 +407,67 @@ class TestCreditEndpoints:
         assert "data" in data
         assert "pagination" in data
     
-    def test_list_credits_with_filters(self):
+    def test_list_credits_with_filters(self, client, credit_owner):
         """Test listing credits with filters"""
         response = client.get("/credits?status=active&vintage=2024")
         assert response.status_code == 200
+        
+        for query, expected in [
+            ("", 3),
+            ("&vintage=2024", 2),
+            ("&status=active", 2),
+            ("&status=active&vintage=2024", 1),
+            ("&vintage=2022", 0),
+        ]:
+            data = client.get(f"/credits?owner={credit_owner}{query}").json()
+            assert data["pagination"]["total"] == expected, query
+            assert len(data["data"]) == expected
+            assert all(credit["owner"] == credit_owner for credit in data["data"])
+    
+    def test_get_credit_not_modified(self, client, credit_owner):
+        """Test getting a credit, and 304 Not Modified for a matching ETag"""
+        credit_id = seed_credit(credit_owner, 2022)
+        response = client.get(f"/credits/{credit_id}")
+        assert response.status_code == 200
+        assert response.json()["token_id"] == credit_id
+        
+        response = client.get(
+            f"/credits/{credit_id}",
+            headers={"If-None-Match": response.headers["etag"]}
+        )
+        assert response.status_code == 304
+        
+        assert client.get("/credits/missing-credit").status_code == 404
+    
+    def test_retire_credit(self, client):
+        """Test retiring a credit updates it and its ETag, and works only once"""
+        owner = f"0x{token_hex(20)}"
+        credit_id = seed_credit(owner)
+        tag = client.get(f"/credits/{credit_id}").headers["etag"]
+        
+        response = client.post(
+            f"/credits/{credit_id}/retire",
+            json={"reason": "offset"},
+            headers={"Authorization": MOCK_TOKEN}
+        )
+        assert response.status_code == 200
+        assert response.json()["status"] == "retired"
+        
+        response = client.get(f"/credits/{credit_id}", headers={"If-None-Match": tag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != tag
+        credit = response.json()
+        assert credit["retired"] is True
+        assert credit["retirement_timestamp"] is not None
+        
+        response = client.post(
+            f"/credits/{credit_id}/retire",
+            json={"reason": "offset"},
+            headers={"Authorization": MOCK_TOKEN}
+        )
+        assert response.status_code == 400
     
-    def test_transfer_credits(self):
+    def test_transfer_credits(self, client):
         """Test transferring credits"""
         transfer_data = {
             "credit_ids": ["credit_1", "credit_2"],
@@ -401,10 +489,18 @@ class TestCreditEndpoints:
 class TestValidation:
     """Test data validation"""
     
-    def test_invalid_geometry_type(self):
-        """Test invalid geometry type rejection"""
-        invalid_pdd = VALID_PDD.copy()
-        invalid_pdd["geometry"]["type"] = "InvalidType"
+    @pytest.mark.parametrize("path, value", [
+        (("type",), "InvalidType"),
+        (("geometry", "type"), "InvalidType"),
+        (("properties", "project_type"), "invalid_type"),
+        (("ogcr_version",), "invalid"),
+        (("properties", "creation_date"), "2024-13-45T10:00:00Z"),
+    ], ids=["document_type", "geometry_type", "project_type", "ogcr_version",
+            "creation_date_out_of_range"])
+    def test_invalid_field_rejected(self, client, path, value):
+        """Test project creation rejects an invalid field value"""
+        invalid_pdd = clone_pdd()
+        set_field(invalid_pdd, path, value)
         
         response = client.post(
             "/projects",
@@ -412,43 +508,54 @@ class TestValidation:
             headers={"Authorization": MOCK_TOKEN}
         )
         assert response.status_code == 422
-    
-    def test_invalid_project_type(self):
-        """Test invalid project type rejection"""
-        invalid_pdd = VALID_PDD.copy()
-        invalid_pdd["properties"]["project_type"] = "invalid_type"
-        
-        response = client.post(
-            "/projects",
-            json=invalid_pdd,
-            headers={"Authorization": MOCK_TOKEN}
-        )
-        assert response.status_code == 422
-    
-    def test_invalid_ogcr_version(self):
-        """Test invalid OGCR version rejection"""
-        invalid_pdd = VALID_PDD.copy()
-        invalid_pdd["ogcr_version"] = "invalid"
-        
+
+    @pytest.mark.parametrize("content, content_type, error_type", [
+        (VALID_PDD_BODY, "text/plain", "model_attributes_type"),
+        (b"", "application/json", "missing"),
+    ], ids=["non_json_content_type", "empty_body"])
+    def test_unparsed_body_rejected(self, client, content, content_type, error_type):
+        """Test project creation rejects bodies FastAPI would not parse as JSON"""
         response = client.post(
             "/projects",
-            json=invalid_pdd,
-            headers={"Authorization": MOCK_TOKEN}
+            content=content,
+            headers={"Content-Type": content_type, "Authorization": MOCK_TOKEN}
         )
         assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == error_type
+
+    def test_validation_cache(self, client):
+        """Test repeated bodies are validated once and still create separate projects"""
+        document = clone_pdd()
+        document["properties"]["name"] = f"Cached Project {token_hex(8)}"
+        body = orjson.dumps(document)
+        invalid_body = orjson.dumps({**document, "ogcr_version": "invalid"})
+        before = client.get("/debug/cache_stats").json()["pdd"]
+
+        created = [
+            client.post("/projects", content=body, headers=JSON_HEADERS).json()
+            for _ in range(2)
+        ]
+        for _ in range(2):
+            response = client.post("/projects", content=invalid_body, headers=JSON_HEADERS)
+            assert response.status_code == 422
+
+        after = client.get("/debug/cache_stats").json()["pdd"]
+        assert after["hits"] - before["hits"] == 1
+        assert after["misses"] - before["misses"] == 3
+
+        assert created[0]["id"] != created[1]["id"]
+        for data in created:
+            stored = client.get(f"/projects/{data['id']}").json()
+            assert stored["id"] == data["id"]
+            assert stored["properties"]["creation_date"] == data["created_at"]
 
 class TestErrorHandling:
     """Test error handling"""
     
-    def test_404_for_invalid_endpoint(self):
-        """Test 404 for non-existent endpoints"""
-        response = client.get("/invalid-endpoint")
-        assert response.status_code == 404
-    
-    def test_method_not_allowed(self):
-        """Test 405 for invalid HTTP methods"""
-        response = client.delete("/projects")
-        assert response.status_code == 405
+    def test_error_handling(self, client):
+        """Test 404 for non-existent endpoints and 405 for invalid HTTP methods"""
+        assert client.get("/invalid-endpoint").status_code == 404
+        assert client.delete("/projects").status_code == 405
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
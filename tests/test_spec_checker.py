@@ -7,68 +7,93 @@ Copyright (c) 2025 OGCR Consortium
 
 import pytest
 import json
-import tempfile
+import multiprocessing
 import os
 import sys
-from pathlib import Path
-
-# Add the tools directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
 
+import spec_checker
+from helpers import set_field
 from spec_checker import OGCRSpecChecker
 
+def clone_pdd():
+    """Fresh copy of the valid PDD test document, safe to modify"""
+    return {
+        "type": "Feature",
+        "id": "test_project",
+        "ogcr_version": "0.1.0",
+        "profile": "pdd",
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]
+        },
+        "properties": {
+            "name": "Test Project",
+            "creation_date": "2024-12-07T10:00:00Z",
+            "project_type": "afforestation",
+            "status": "draft",
+            "actor_id": "test-actor"
+        }
+    }
+
+def clone_mrv():
+    """Fresh copy of the valid MRV test document, safe to modify"""
+    return {
+        "type": "Feature",
+        "id": "test_mrv",
+        "ogcr_version": "0.1.0",
+        "profile": "mrv",
+        "geometry": {
+            "type": "Point",
+            "coordinates": [0, 0]
+        },
+        "properties": {
+            "project_id": "test_project",
+            "methodology_id": "test_methodology",
+            "start_date": "2024-01-01",
+            "end_date": "2024-12-31",
+            "methodology_data": {
+                "parameters": {},
+                "measurement_devices": [],
+                "sampling_strategy": "Random"
+            },
+            "net_removal_estimate": {
+                "value": 1000.0,
+                "unit": "tCO2e"
+            }
+        }
+    }
+
+@pytest.fixture(scope="module")
+def checker(tmp_path_factory):
+    """Spec checker shared by the module's tests, so schemas load only once"""
+    checker = OGCRSpecChecker(cache_dir=str(tmp_path_factory.mktemp("cache")))
+    yield checker
+    checker.close()
+
+@pytest.fixture(scope="session")
+def valid_json_file(tmp_path_factory):
+    """Path of a valid PDD JSON file, written once per session"""
+    path = tmp_path_factory.mktemp("spec") / "valid.json"
+    path.write_text(json.dumps(clone_pdd()))
+    return str(path)
+
+@pytest.fixture(scope="session")
+def invalid_json_file(tmp_path_factory):
+    """Path of a file that is not valid JSON, written once per session"""
+    path = tmp_path_factory.mktemp("spec") / "invalid.json"
+    path.write_text("invalid json content")
+    return str(path)
+
 class TestOGCRSpecChecker:
     """Test the OGCR specification checker"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_documents(self, checker):
         """Set up test fixtures"""
-        self.checker = OGCRSpecChecker()
-        
-        # Valid PDD document
-        self.valid_pdd = {
-            "type": "Feature",
-            "id": "test_project",
-            "ogcr_version": "0.1.0",
-            "profile": "pdd",
-            "geometry": {
-                "type": "Polygon",
-                "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]
-            },
-            "properties": {
-                "name": "Test Project",
-                "creation_date": "2024-12-07T10:00:00Z",
-                "project_type": "afforestation",
-                "status": "draft",
-                "actor_id": "test-actor"
-            }
-        }
+        self.checker = checker
         
-        # Valid MRV document
-        self.valid_mrv = {
-            "type": "Feature",
-            "id": "test_mrv",
-            "ogcr_version": "0.1.0",
-            "profile": "mrv",
-            "geometry": {
-                "type": "Point",
-                "coordinates": [0, 0]
-            },
-            "properties": {
-                "project_id": "test_project",
-                "methodology_id": "test_methodology",
-                "start_date": "2024-01-01",
-                "end_date": "2024-12-31",
-                "methodology_data": {
-                    "parameters": {},
-                    "measurement_devices": [],
-                    "sampling_strategy": "Random"
-                },
-                "net_removal_estimate": {
-                    "value": 1000.0,
-                    "unit": "tCO2e"
-                }
-            }
-        }
+        self.valid_pdd = clone_pdd()
+        self.valid_mrv = clone_mrv()
 
 class TestDocumentValidation(TestOGCRSpecChecker):
     """Test document validation functionality"""
@@ -85,6 +110,20 @@ class TestDocumentValidation(TestOGCRSpecChecker):
         assert valid, f"Validation failed with errors: {errors}"
         assert len(errors) == 0
     
+    def test_compiled_validators_loaded(self):
+        """Test both schemas get a compiled fast-path validator"""
+        assert set(self.checker.fast_validators) == {"pdd", "mrv"}
+    
+    def test_compiled_validators_cached(self):
+        """Test compiled validators are saved and reused from the cache directory"""
+        cached = sorted(os.listdir(self.checker.cache_dir))
+        assert [name.split("_")[1] for name in cached if name.endswith(".py")] == ["mrv", "pdd"]
+        
+        checker = OGCRSpecChecker(cache_dir=self.checker.cache_dir)
+        assert sorted(os.listdir(self.checker.cache_dir)) == cached
+        valid, errors = checker.validate_document(self.valid_pdd, "pdd")
+        assert valid, errors
+    
     def test_auto_detect_pdd_type(self):
         """Test auto-detection of PDD document type"""
         valid, errors = self.checker.validate_document(self.valid_pdd)
@@ -94,110 +133,150 @@ class TestDocumentValidation(TestOGCRSpecChecker):
         """Test auto-detection of MRV document type"""
         valid, errors = self.checker.validate_document(self.valid_mrv)
         assert valid
+
+    @pytest.mark.parametrize("profile", [None, "unknown-profile", ["pdd"]])
+    def test_auto_detect_from_properties(self, profile):
+        """Test detection falls back to properties without a known profile"""
+        pdd = clone_pdd()
+        mrv = clone_mrv()
+        pdd["profile"] = mrv["profile"] = profile
+        assert self.checker._detect_document_type(pdd) == "pdd"
+        assert self.checker._detect_document_type(mrv) == "mrv"
+        assert self.checker._detect_document_type({"profile": profile}) == "unknown"
+
+    @pytest.mark.parametrize("path, value, message", [
+        (("type",), "InvalidType", "Document must be a GeoJSON Feature"),
+        (("geometry", "type"), "InvalidGeometry", "Invalid geometry type"),
+        (("geometry", "type"), ["Point"], "Invalid geometry type"),
+        (("ogcr_version",), "invalid-version", "Invalid ogcr_version format"),
+        (("ogcr_version",), "0.1.0\n", "Invalid ogcr_version format"),
+    ], ids=["document_type", "geometry_type", "geometry_type_array", "ogcr_version",
+            "ogcr_version_newline"])
+    def test_invalid_field(self, path, value, message):
+        """Test validation with an invalid field value"""
+        invalid_doc = clone_pdd()
+        set_field(invalid_doc, path, value)
+        
+        valid, errors = self.checker.validate_document(invalid_doc, "pdd")
+        assert not valid
+        assert message in "\n".join(errors)
     
-    def test_invalid_document_type(self):
-        """Test handling of invalid document type"""
-        invalid_doc = self.valid_pdd.copy()
+    def test_all_schema_errors_reported(self):
+        """Test every schema violation is reported, not just the first"""
+        invalid_doc = clone_pdd()
         invalid_doc["type"] = "InvalidType"
+        invalid_doc["ogcr_version"] = "invalid-version"
         
         valid, errors = self.checker.validate_document(invalid_doc, "pdd")
         assert not valid
-        assert any("Document must be a GeoJSON Feature" in error for error in errors)
-    
+        messages = "\n".join(errors)
+        assert "Path: type" in messages
+        assert "Path: ogcr_version" in messages
+
+    def test_fast_fail_stops_at_first_error(self):
+        """Test fast_fail reports only the first schema violation"""
+        invalid_doc = clone_pdd()
+        invalid_doc["type"] = "InvalidType"
+        invalid_doc["ogcr_version"] = "invalid-version"
+
+        valid, errors = self.checker.validate_document(invalid_doc, "pdd", fast_fail=True)
+        assert not valid
+        assert len([e for e in errors if e.startswith("Schema validation error")]) == 1
+
+        valid, errors = self.checker.validate_document(self.valid_pdd, "pdd", fast_fail=True)
+        assert valid
+        assert errors == []
+
+    def test_helpers_match_combined_checks(self):
+        """Test the per-area helpers report what the combined pass reports"""
+        invalid_doc = clone_pdd()
+        invalid_doc["bbox"] = [0, 0, 1]
+        invalid_doc["ogcr_version"] = "1.0"
+        invalid_doc["links"] = [{"href": "not-a-url"}]
+        invalid_doc["properties"]["creation_date"] = "yesterday"
+
+        helpers = (self.checker._validate_geojson_compliance, self.checker._validate_ogcr_version,
+                   self.checker._validate_links, self.checker._validate_pdd_specific)
+        errors = [error for helper in helpers for error in helper(invalid_doc)]
+        assert len(errors) == 5
+        assert self.checker._validate_ogcr_requirements(invalid_doc, "pdd") == errors
+
     def test_missing_required_fields(self):
         """Test validation with missing required fields"""
-        invalid_doc = self.valid_pdd.copy()
+        invalid_doc = clone_pdd()
         del invalid_doc["geometry"]
         
         valid, errors = self.checker.validate_document(invalid_doc, "pdd")
         assert not valid
-        assert any("Missing required geometry field" in error for error in errors)
+        assert "Missing required geometry field" in "\n".join(errors)
     
-    def test_invalid_geometry_type(self):
-        """Test validation with invalid geometry type"""
-        invalid_doc = self.valid_pdd.copy()
-        invalid_doc["geometry"]["type"] = "InvalidGeometry"
-        
-        valid, errors = self.checker.validate_document(invalid_doc, "pdd")
-        assert not valid
-        assert any("Invalid geometry type" in error for error in errors)
+class TestBatchValidation(TestOGCRSpecChecker):
+    """Test batch document validation"""
     
-    def test_invalid_ogcr_version(self):
-        """Test validation with invalid OGCR version"""
-        invalid_doc = self.valid_pdd.copy()
+    def test_validate_documents(self):
+        """Test a batch returns one result per document, in order"""
+        invalid_doc = clone_pdd()
         invalid_doc["ogcr_version"] = "invalid-version"
         
-        valid, errors = self.checker.validate_document(invalid_doc, "pdd")
-        assert not valid
-        assert any("Invalid ogcr_version format" in error for error in errors)
+        results = self.checker.validate_documents([self.valid_pdd, invalid_doc, self.valid_mrv])
+        assert [valid for valid, _ in results] == [True, False, True]
+        assert "Invalid ogcr_version format" in "\n".join(results[1][1])
 
 class TestPDDSpecificValidation(TestOGCRSpecChecker):
     """Test PDD-specific validation rules"""
     
-    def test_invalid_creation_date(self):
-        """Test validation with invalid creation date"""
-        invalid_doc = self.valid_pdd.copy()
-        invalid_doc["properties"]["creation_date"] = "invalid-date"
-        
-        valid, errors = self.checker.validate_document(invalid_doc, "pdd")
-        assert not valid
-        assert any("Invalid creation_date format" in error for error in errors)
-    
-    def test_negative_expected_benefit(self):
-        """Test validation with negative expected benefit"""
-        invalid_doc = self.valid_pdd.copy()
-        invalid_doc["properties"]["expected_annual_benefit"] = -100
+    @pytest.mark.parametrize("path, value, message", [
+        (("properties", "creation_date"), "invalid-date",
+         "Invalid creation_date format"),
+        (("properties", "expected_annual_benefit"), -100,
+         "expected_annual_benefit must be non-negative"),
+        (("properties", "methodology"), {"id": "test", "version": "invalid-version"},
+         "Invalid methodology version format"),
+    ], ids=["creation_date", "expected_annual_benefit", "methodology_version"])
+    def test_invalid_property(self, path, value, message):
+        """Test validation with an invalid PDD property"""
+        invalid_doc = clone_pdd()
+        set_field(invalid_doc, path, value)
         
         valid, errors = self.checker.validate_document(invalid_doc, "pdd")
         assert not valid
-        assert any("expected_annual_benefit must be non-negative" in error for error in errors)
-    
-    def test_invalid_methodology_version(self):
-        """Test validation with invalid methodology version"""
-        invalid_doc = self.valid_pdd.copy()
-        invalid_doc["properties"]["methodology"] = {
-            "id": "test",
-            "version": "invalid-version"
-        }
-        
-        valid, errors = self.checker.validate_document(invalid_doc, "pdd")
-        assert not valid
-        assert any("Invalid methodology version format" in error for error in errors)
+        assert message in "\n".join(errors)
 
 class TestMRVSpecificValidation(TestOGCRSpecChecker):
     """Test MRV-specific validation rules"""
     
     def test_invalid_date_range(self):
         """Test validation with invalid date range"""
-        invalid_doc = self.valid_mrv.copy()
+        invalid_doc = clone_mrv()
         invalid_doc["properties"]["start_date"] = "2024-12-31"
         invalid_doc["properties"]["end_date"] = "2024-01-01"
         
         valid, errors = self.checker.validate_document(invalid_doc, "mrv")
         assert not valid
-        assert any("start_date must be before end_date" in error for error in errors)
+        assert "start_date must be before end_date" in "\n".join(errors)
     
     def test_negative_removal_estimate(self):
         """Test validation with negative removal estimate"""
-        invalid_doc = self.valid_mrv.copy()
+        invalid_doc = clone_mrv()
         invalid_doc["properties"]["net_removal_estimate"]["value"] = -100
         
         valid, errors = self.checker.validate_document(invalid_doc, "mrv")
         assert not valid
-        assert any("net_removal_estimate value must be non-negative" in error for error in errors)
+        assert "net_removal_estimate value must be non-negative" in "\n".join(errors)
     
-    def test_invalid_carbon_unit(self):
+    @pytest.mark.parametrize("unit", ["invalid_unit", ["tCO2e"]], ids=["string", "array"])
+    def test_invalid_carbon_unit(self, unit):
         """Test validation with invalid carbon unit"""
-        invalid_doc = self.valid_mrv.copy()
-        invalid_doc["properties"]["net_removal_estimate"]["unit"] = "invalid_unit"
+        invalid_doc = clone_mrv()
+        invalid_doc["properties"]["net_removal_estimate"]["unit"] = unit
         
         valid, errors = self.checker.validate_document(invalid_doc, "mrv")
         assert not valid
-        assert any("Invalid unit" in error for error in errors)
+        assert "Invalid unit" in "\n".join(errors)
     
     def test_invalid_uncertainty_range(self):
         """Test validation with invalid uncertainty range"""
-        invalid_doc = self.valid_mrv.copy()
+        invalid_doc = clone_mrv()
         invalid_doc["properties"]["total_uncertainty"] = {
             "min": 1000,
             "max": 500,
@@ -206,11 +285,11 @@ class TestMRVSpecificValidation(TestOGCRSpecChecker):
         
         valid, errors = self.checker.validate_document(invalid_doc, "mrv")
         assert not valid
-        assert any("uncertainty min must be <= max" in error for error in errors)
+        assert "uncertainty min must be <= max" in "\n".join(errors)
     
     def test_invalid_confidence_level(self):
         """Test validation with invalid confidence level"""
-        invalid_doc = self.valid_mrv.copy()
+        invalid_doc = clone_mrv()
         invalid_doc["properties"]["total_uncertainty"] = {
             "min": 500,
             "max": 1000,
@@ -219,14 +298,14 @@ class TestMRVSpecificValidation(TestOGCRSpecChecker):
         
         valid, errors = self.checker.validate_document(invalid_doc, "mrv")
         assert not valid
-        assert any("confidence_level must be between 0 and 1" in error for error in errors)
+        assert "confidence_level must be between 0 and 1" in "\n".join(errors)
 
 class TestLinksValidation(TestOGCRSpecChecker):
     """Test links validation"""
     
     def test_valid_links(self):
         """Test validation with valid links"""
-        doc_with_links = self.valid_pdd.copy()
+        doc_with_links = clone_pdd()
         doc_with_links["links"] = [
             {
                 "rel": "methodology",
@@ -241,7 +320,7 @@ class TestLinksValidation(TestOGCRSpecChecker):
     
     def test_invalid_link_url(self):
         """Test validation with invalid link URL"""
-        doc_with_links = self.valid_pdd.copy()
+        doc_with_links = clone_pdd()
         doc_with_links["links"] = [
             {
                 "rel": "methodology",
@@ -251,11 +330,11 @@ class TestLinksValidation(TestOGCRSpecChecker):
         
         valid, errors = self.checker.validate_document(doc_with_links, "pdd")
         assert not valid
-        assert any("href is not a valid URL" in error for error in errors)
+        assert "href is not a valid URL" in "\n".join(errors)
     
     def test_missing_link_fields(self):
         """Test validation with missing link fields"""
-        doc_with_links = self.valid_pdd.copy()
+        doc_with_links = clone_pdd()
         doc_with_links["links"] = [
             {
                 "href": "https://example.com"
@@ -265,11 +344,11 @@ class TestLinksValidation(TestOGCRSpecChecker):
 
         valid, errors = self.checker.validate_document(doc_with_links, "pdd")
         assert not valid
-        assert any("missing required 'rel' field" in error for error in errors)
+        assert "missing required 'rel' field" in "\n".join(errors)
 
     def test_links_field_not_array(self):
         """Links field must be an array of link objects"""
-        doc_with_links = self.valid_pdd.copy()
+        doc_with_links = clone_pdd()
         # Provide a single link object instead of an array
         doc_with_links["links"] = {
             "rel": "self",
@@ -280,16 +359,17 @@ class TestLinksValidation(TestOGCRSpecChecker):
         assert not valid
         # Schema should complain about type mismatch, and our validator should
         # add a clear error without emitting per-character object errors.
-        assert any("is not of type 'array'" in error for error in errors)
-        assert any("links must be an array" in error for error in errors)
-        assert not any("Link 0 must be an object" in error for error in errors)
+        messages = "\n".join(errors)
+        assert "is not of type 'array'" in messages
+        assert "links must be an array" in messages
+        assert "Link 0 must be an object" not in messages
 
 class TestBboxValidation(TestOGCRSpecChecker):
     """Test bbox validation"""
     
     def test_valid_bbox(self):
         """Test validation with valid bbox"""
-        doc_with_bbox = self.valid_pdd.copy()
+        doc_with_bbox = clone_pdd()
         doc_with_bbox["bbox"] = [0, 0, 1, 1]
         
         valid, errors = self.checker.validate_document(doc_with_bbox, "pdd")
@@ -297,56 +377,110 @@ class TestBboxValidation(TestOGCRSpecChecker):
     
     def test_invalid_bbox_length(self):
         """Test validation with invalid bbox length"""
-        doc_with_bbox = self.valid_pdd.copy()
+        doc_with_bbox = clone_pdd()
         doc_with_bbox["bbox"] = [0, 0, 1]  # Should be 4 elements
         
         valid, errors = self.checker.validate_document(doc_with_bbox, "pdd")
         assert not valid
-        assert any("bbox must be an array of 4 numbers" in error for error in errors)
+        assert "bbox must be an array of 4 numbers" in "\n".join(errors)
     
-    def test_invalid_bbox_values(self):
+    @pytest.mark.parametrize("value", ["invalid", True], ids=["string", "boolean"])
+    def test_invalid_bbox_values(self, value):
         """Test validation with invalid bbox values"""
-        doc_with_bbox = self.valid_pdd.copy()
-        doc_with_bbox["bbox"] = [0, 0, "invalid", 1]
+        doc_with_bbox = clone_pdd()
+        doc_with_bbox["bbox"] = [0, 0, value, 1]
         
         valid, errors = self.checker.validate_document(doc_with_bbox, "pdd")
         assert not valid
-        assert any("bbox values must be numbers" in error for error in errors)
+        assert "bbox values must be numbers" in "\n".join(errors)
 
 class TestFileValidation(TestOGCRSpecChecker):
     """Test file validation functionality"""
     
-    def test_validate_valid_file(self):
+    def test_validate_valid_file(self, valid_json_file):
         """Test validation of valid JSON file"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(self.valid_pdd, f)
-            temp_file = f.name
-        
-        try:
-            valid, errors = self.checker.validate_file(temp_file)
-            assert valid
-            assert len(errors) == 0
-        finally:
-            os.unlink(temp_file)
+        valid, errors = self.checker.validate_file(valid_json_file)
+        assert valid
+        assert len(errors) == 0
     
-    def test_validate_invalid_json_file(self):
+    def test_validate_invalid_json_file(self, invalid_json_file):
         """Test validation of invalid JSON file"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write("invalid json content")
-            temp_file = f.name
-        
-        try:
-            valid, errors = self.checker.validate_file(temp_file)
-            assert not valid
-            assert any("Invalid JSON" in error for error in errors)
-        finally:
-            os.unlink(temp_file)
+        valid, errors = self.checker.validate_file(invalid_json_file)
+        assert not valid
+        assert "Invalid JSON" in "\n".join(errors)
     
     def test_validate_nonexistent_file(self):
         """Test validation of non-existent file"""
         valid, errors = self.checker.validate_file("nonexistent.json")
         assert not valid
-        assert any("File not found" in error for error in errors)
+        assert "File not found" in "\n".join(errors)
+
+    def test_unchanged_file_result_cached(self, tmp_path, monkeypatch):
+        """Test unchanged files reuse the stored result and edited ones do not"""
+        path = tmp_path / "pdd.json"
+        path.write_text(json.dumps(self.valid_pdd))
+        assert self.checker.validate_file(str(path)) == (True, [])
+
+        calls = []
+        monkeypatch.setattr(self.checker, "validate_document",
+                            lambda document, **kwargs: calls.append(document) or (False, ["changed"]))
+        assert self.checker.validate_file(str(path)) == (True, [])
+        assert calls == []
+
+        path.write_text(json.dumps(self.valid_pdd, indent=2))
+        assert self.checker.validate_file(str(path)) == (False, ["changed"])
+        assert len(calls) == 1
+
+    def test_validate_files_in_process_pool(self, valid_json_file, invalid_json_file, monkeypatch):
+        """Test files spread over worker processes come back in order"""
+        monkeypatch.setattr(spec_checker.os, "cpu_count", lambda: 2)
+        results = list(spec_checker.validate_files(self.checker, [invalid_json_file, valid_json_file]))
+        assert [valid for valid, _ in results] == [False, True]
+        assert "Invalid JSON" in "\n".join(results[0][1])
+
+    def test_validate_files_close_stops_workers(self, valid_json_file, monkeypatch):
+        """Test closing the results generator shuts down the worker processes"""
+        monkeypatch.setattr(spec_checker.os, "cpu_count", lambda: 2)
+        results = spec_checker.validate_files(self.checker, [valid_json_file, valid_json_file])
+        assert next(results) == (True, [])
+        assert next(results) == (True, [])
+        assert multiprocessing.active_children()
+        
+        results.close()
+        assert not multiprocessing.active_children()
+
+class TestAPIValidation(TestOGCRSpecChecker):
+    """Test API endpoint validation"""
+    
+    def test_validate_api_endpoints_keeps_order(self, monkeypatch):
+        """Test concurrent endpoint results come back in endpoint order"""
+        def fake_validate(base_url, endpoint):
+            return endpoint == "/health", [f"{base_url}{endpoint}"]
+        monkeypatch.setattr(self.checker, "validate_api_endpoint", fake_validate)
+        
+        results = self.checker.validate_api_endpoints("http://api", ["/health", "/projects"])
+        assert results == [
+            (True, ["http://api/health"]),
+            (False, ["http://api/projects"])
+        ]
+    
+    def test_validate_api_endpoint_uses_session(self, monkeypatch):
+        """Test endpoint requests go through the checker's pooled session"""
+        class FakeResponse:
+            status_code = 200
+            content = json.dumps({"data": [self.valid_pdd]}).encode()
+
+        urls = []
+        monkeypatch.setattr(self.checker.session, "get",
+                            lambda url, **kwargs: urls.append(url) or FakeResponse())
+        assert self.checker.validate_api_endpoint("http://api/", "/projects") == (True, [])
+        assert urls == ["http://api/projects"]
+
+    def test_host_slots_shared_per_host(self):
+        """Test requests to one host share a concurrency limit"""
+        slot = self.checker._host_slot("http://api.example.com/health")
+        assert self.checker._host_slot("http://api.example.com/projects") is slot
+        assert self.checker._host_slot("http://other.example.com/health") is not slot
 
 class TestComplianceReport(TestOGCRSpecChecker):
     """Test compliance report generation"""
@@ -368,12 +502,38 @@ class TestComplianceReport(TestOGCRSpecChecker):
         
         report = self.checker.generate_compliance_report(results)
         
-        assert "OGCR API Specification Compliance Report" in report
-        assert "Summary: 1/2 tests passed" in report
-        assert "[PASS] Test 1" in report
-        assert "[FAIL] Test 2" in report
-        assert "Error 1" in report
-        assert "Error 2" in report
+        expected = (
+            "OGCR API Specification Compliance Report",
+            "Summary: 1/2 tests passed",
+            "[PASS] Test 1",
+            "[FAIL] Test 2",
+            "Error 1",
+            "Error 2",
+        )
+        missing = [text for text in expected if text not in report]
+        assert not missing, missing
+
+class TestCommandLine:
+    """Test the spec checker command line"""
+    
+    @pytest.mark.parametrize("expect_invalid, exit_code", [
+        ("missing.json", 1),
+        ("invalid.json", 0),
+    ], ids=["missing_file", "invalid_file"])
+    def test_expect_invalid_exit_code(self, tmp_path, monkeypatch,
+                                      valid_json_file, expect_invalid, exit_code):
+        """Test --expect-invalid passes for an invalid document but not a missing file"""
+        (tmp_path / "invalid.json").write_text("invalid json content")
+        monkeypatch.setenv("OGCR_CACHE_DIR", str(tmp_path / "cache"))
+        monkeypatch.setattr(sys, "argv", [
+            "spec_checker.py", "--file", valid_json_file,
+            "--expect-invalid", str(tmp_path / expect_invalid)
+        ])
+        
+        with pytest.raises(SystemExit) as exit_info:
+            spec_checker.main()
+            raise SystemExit(0)
+        assert exit_info.value.code == exit_code
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
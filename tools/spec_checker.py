@@ -9,32 +9,89 @@ Copyright (c) 2025 OGCR Consortium
 """
 
 import json
+import orjson
+import fastjsonschema
 import jsonschema
+from jsonschema.validators import validator_for
 import argparse
+import contextlib
+import hashlib
+import importlib.util
+import io
+import sqlite3
 import sys
 import os
-from typing import Dict, List, Any, Tuple
+import threading
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, List, Any, Tuple
 from datetime import datetime
 import re
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse
 
+# Upper bound on endpoints fetched at the same time, overall and per host
+MAX_CONCURRENT_REQUESTS = 8
+MAX_REQUESTS_PER_HOST = 4
+
+# Compiled schema validators and file results are kept here between runs
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ogcr")
+RESULTS_DB_NAME = "results.sqlite"
+
+# Documents repeat the same link targets, so parsed URLs are memoized
+cached_urlparse = lru_cache(maxsize=4096)(urlparse)
+
+# Document type for each known profile value
+DOCUMENT_PROFILES = {'pdd': 'pdd', 'mrv': 'mrv'}
+
+# Allowed geometry types, and net removal units (listed in message order)
+GEOMETRY_TYPES = frozenset(('Point', 'LineString', 'Polygon', 'MultiPoint', 'MultiLineString', 'MultiPolygon'))
+REMOVAL_UNITS = ('tCO2e', 'kgCO2e', 'tCO2', 'kgCO2')
+REMOVAL_UNIT_SET = frozenset(REMOVAL_UNITS)
+
+# Exact types of parsed JSON numbers; bool is excluded since JSON true and
+# false are not numbers
+BBOX_NUMBER_TYPES = (int, float)
+
+# Version formats, compiled once at import. \Z (unlike $) also rejects a
+# trailing newline.
+SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+\Z')
+METHODOLOGY_VERSION_RE = re.compile(r'^\d+\.\d+(?:\.\d+)?\Z')
+
 class OGCRSpecChecker:
     """Comprehensive OGCR API specification checker"""
     
-    def __init__(self, schema_dir: str = None):
-        """Initialize the spec checker with schema directory"""
+    def __init__(self, schema_dir: str = None, cache_dir: str = None):
+        """Initialize the spec checker with schema and validator cache directories"""
         if schema_dir is None:
             # Default to schemas directory relative to this file
             current_dir = os.path.dirname(os.path.abspath(__file__))
             schema_dir = os.path.join(os.path.dirname(current_dir), "schemas")
+        if cache_dir is None:
+            cache_dir = os.environ.get("OGCR_CACHE_DIR", DEFAULT_CACHE_DIR)
         
         self.schema_dir = schema_dir
+        self.cache_dir = cache_dir
         self.schemas = {}
+        self.validators = {}
+        self.fast_validators = {}
+        self.host_slots = defaultdict(lambda: threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST))
+        self.host_slots_lock = threading.Lock()
+        self.results_db = None
+        
+        # One pooled session, so repeated requests to a host reuse its
+        # connections instead of a new connection and handshake each
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=MAX_CONCURRENT_REQUESTS, pool_maxsize=MAX_REQUESTS_PER_HOST)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.load_schemas()
+        self.rules_digest = self._get_rules_digest()
         
     def load_schemas(self):
-        """Load JSON schemas from the schema directory"""
+        """Load JSON schemas from the schema directory and build their validators"""
         try:
             # Load PDD schema
             pdd_schema_path = os.path.join(self.schema_dir, "pdd-schema.json")
@@ -48,18 +105,47 @@ class OGCRSpecChecker:
                 with open(mrv_schema_path, 'r') as f:
                     self.schemas['mrv'] = json.load(f)
                     
+            # Check each schema once and keep a validator for it, rather than
+            # re-checking the schema on every validated document
+            for doc_type, schema in list(self.schemas.items()):
+                validator_class = validator_for(schema)
+                try:
+                    validator_class.check_schema(schema)
+                except jsonschema.SchemaError as e:
+                    print(f"Invalid {doc_type} schema: {e.message}")
+                    del self.schemas[doc_type]
+                    continue
+                self.validators[doc_type] = validator_class(schema)
+                
+                # Generated code that accepts valid documents quickly; format
+                # checks stay off to match the jsonschema validator
+                try:
+                    self.fast_validators[doc_type] = self._get_compiled_validator(doc_type, schema)
+                except fastjsonschema.JsonSchemaDefinitionException as e:
+                    print(f"Falling back to jsonschema for {doc_type} schema: {e}")
+                    
             print(f"Loaded {len(self.schemas)} schemas from {self.schema_dir}")
             
         except Exception as e:
             print(f"Error loading schemas: {e}")
             
-    def validate_document(self, document: Dict[str, Any], doc_type: str = None) -> Tuple[bool, List[str]]:
+    def _get_rules_digest(self) -> str:
+        """Hash of the loaded schemas and of this checker's code"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(self.schemas, sort_keys=True).encode())
+        with open(__file__, 'rb') as f:
+            digest.update(f.read())
+        return digest.hexdigest()
+        
+    def validate_document(self, document: Dict[str, Any], doc_type: str = None,
+                          fast_fail: bool = False) -> Tuple[bool, List[str]]:
         """
         Validate a document against the appropriate schema
         
         Args:
             document: The document to validate
             doc_type: Document type ('pdd' or 'mrv'), auto-detected if None
+            fast_fail: Stop at the first error, for callers that only need pass/fail
             
         Returns:
             Tuple of (is_valid, list_of_errors)
@@ -74,60 +160,161 @@ class OGCRSpecChecker:
             errors.append(f"Unknown document type: {doc_type}")
             return False, errors
             
-        # Validate against JSON schema
-        try:
-            jsonschema.validate(document, self.schemas[doc_type])
-        except jsonschema.ValidationError as e:
-            errors.append(f"Schema validation error: {e.message}")
-            if e.path:
-                errors.append(f"  Path: {' -> '.join(str(p) for p in e.path)}")
-        except jsonschema.SchemaError as e:
-            errors.append(f"Schema error: {e.message}")
+        # Validate against JSON schema. Documents the compiled validator
+        # rejects go through jsonschema, which reports every violation.
+        if not self._passes_fast_schema_check(document, doc_type):
+            for error in self.validators[doc_type].iter_errors(document):
+                errors.append(f"Schema validation error: {error.message}")
+                if error.path:
+                    errors.append(f"  Path: {' -> '.join(str(p) for p in error.path)}")
+                if fast_fail:
+                    return False, errors
             
         # Additional OGCR-specific validations
-        additional_errors = self._validate_ogcr_requirements(document, doc_type)
-        errors.extend(additional_errors)
+        self._validate_all(document, doc_type, errors, fast_fail)
         
         return len(errors) == 0, errors
         
+    def validate_documents(self, documents: List[Dict[str, Any]], doc_type: str = None) -> List[Tuple[bool, List[str]]]:
+        """
+        Validate a batch of documents with the loaded validators
+        
+        Args:
+            documents: The documents to validate
+            doc_type: Document type for every document, auto-detected per document if None
+            
+        Returns:
+            List of (is_valid, list_of_errors), one per document, in order
+        """
+        validate = self.validate_document
+        return [validate(document, doc_type) for document in documents]
+        
+    def _get_compiled_validator(self, name: str, schema: Dict[str, Any]):
+        """
+        Compiled fastjsonschema validator for a schema
+        
+        The generated code is saved as a module in the cache directory, keyed
+        by a hash of the schema and the fastjsonschema version, so later runs
+        import it instead of compiling the schema again.
+        """
+        source = json.dumps(schema, sort_keys=True) + fastjsonschema.VERSION
+        digest = hashlib.blake2b(source.encode(), digest_size=16).hexdigest()
+        path = os.path.join(self.cache_dir, f"validate_{name}_{digest}.py")
+        
+        if not os.path.exists(path):
+            code = fastjsonschema.compile_to_code(schema, use_formats=False)
+            # The first generated function validates the whole schema
+            entry = re.search(r'^def (\w+)', code, re.MULTILINE).group(1)
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                temp_path = f"{path}.{os.getpid()}.tmp"
+                with open(temp_path, 'w') as f:
+                    f.write(f"{code}\n\nvalidate = {entry}\n")
+                os.replace(temp_path, path)
+            except OSError:
+                # Cache not writable; compile in memory for this run only
+                return fastjsonschema.compile(schema, use_formats=False)
+                
+        spec = importlib.util.spec_from_file_location(f"ogcr_validate_{name}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.validate
+        
+    def _passes_fast_schema_check(self, document: Dict[str, Any], doc_type: str) -> bool:
+        """Whether the compiled fastjsonschema validator accepts the document"""
+        validate = self.fast_validators.get(doc_type)
+        if validate is None:
+            return False
+        try:
+            validate(document)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+        
     def _detect_document_type(self, document: Dict[str, Any]) -> str:
         """Auto-detect document type from profile field"""
-        profile = document.get('profile', '')
-        if profile == 'pdd':
+        profile = document.get('profile')
+        if isinstance(profile, str) and profile in DOCUMENT_PROFILES:
+            return DOCUMENT_PROFILES[profile]
+        return self._fallback_detect(document)
+        
+    def _fallback_detect(self, document: Dict[str, Any]) -> str:
+        """Detect document type from its properties when the profile is missing"""
+        properties = document.get('properties') or {}
+        if 'project_type' in properties:
             return 'pdd'
-        elif profile == 'mrv':
+        if 'methodology_data' in properties:
             return 'mrv'
-        else:
-            # Fallback detection based on properties
-            properties = document.get('properties', {})
-            if 'project_type' in properties:
-                return 'pdd'
-            elif 'methodology_data' in properties:
-                return 'mrv'
-            else:
-                return 'unknown'
+        return 'unknown'
                 
-    def _validate_ogcr_requirements(self, document: Dict[str, Any], doc_type: str) -> List[str]:
+    def _validate_ogcr_requirements(self, document: Dict[str, Any], doc_type: str,
+                                    fast_fail: bool = False) -> List[str]:
         """Validate OGCR-specific requirements beyond JSON schema"""
         errors = []
+        self._validate_all(document, doc_type, errors, fast_fail)
+        return errors
         
-        # Common validations for all documents
-        errors.extend(self._validate_geojson_compliance(document))
-        errors.extend(self._validate_ogcr_version(document))
-        errors.extend(self._validate_links(document))
+    def _validate_all(self, document: Dict[str, Any], doc_type: str, errors: List[str],
+                      fast_fail: bool = False):
+        """
+        Run every OGCR check in one pass over the document
         
-        # Document-specific validations
+        The checks are called in sequence, each appending to errors. With
+        fast_fail, stops after the first check that finds a problem and keeps
+        only its first error.
+        """
+        self._check_geojson(document, errors)
+        if fast_fail and errors:
+            del errors[1:]
+            return
+        self._check_ogcr_version(document.get('ogcr_version'), errors)
+        if fast_fail and errors:
+            del errors[1:]
+            return
+        self._check_links(document.get('links'), errors)
+        if fast_fail and errors:
+            del errors[1:]
+            return
+            
         if doc_type == 'pdd':
-            errors.extend(self._validate_pdd_specific(document))
+            self._check_pdd(document.get('properties') or {}, errors)
         elif doc_type == 'mrv':
-            errors.extend(self._validate_mrv_specific(document))
-            
-        return errors
-        
+            self._check_mrv(document.get('properties') or {}, errors)
+        if fast_fail and errors:
+            del errors[1:]
+                
     def _validate_geojson_compliance(self, document: Dict[str, Any]) -> List[str]:
         """Validate GeoJSON compliance"""
         errors = []
+        self._check_geojson(document, errors)
+        return errors
+        
+    def _validate_ogcr_version(self, document: Dict[str, Any]) -> List[str]:
+        """Validate OGCR version format"""
+        errors = []
+        self._check_ogcr_version(document.get('ogcr_version'), errors)
+        return errors
         
+    def _validate_links(self, document: Dict[str, Any]) -> List[str]:
+        """Validate links array"""
+        errors = []
+        self._check_links(document.get('links'), errors)
+        return errors
+        
+    def _validate_pdd_specific(self, document: Dict[str, Any]) -> List[str]:
+        """Validate PDD-specific requirements"""
+        errors = []
+        self._check_pdd(document.get('properties') or {}, errors)
+        return errors
+        
+    def _validate_mrv_specific(self, document: Dict[str, Any]) -> List[str]:
+        """Validate MRV-specific requirements"""
+        errors = []
+        self._check_mrv(document.get('properties') or {}, errors)
+        return errors
+        
+    def _check_geojson(self, document: Dict[str, Any], errors: List[str]):
+        """Check GeoJSON compliance"""
         # Check required GeoJSON fields
         if document.get('type') != 'Feature':
             errors.append("Document must be a GeoJSON Feature")
@@ -141,8 +328,7 @@ class OGCRSpecChecker:
                 errors.append("Invalid geometry structure")
             else:
                 geom_type = geometry.get('type')
-                valid_types = ['Point', 'LineString', 'Polygon', 'MultiPoint', 'MultiLineString', 'MultiPolygon']
-                if geom_type not in valid_types:
+                if not isinstance(geom_type, str) or geom_type not in GEOMETRY_TYPES:
                     errors.append(f"Invalid geometry type: {geom_type}")
                     
         # Validate bbox if present
@@ -150,30 +336,20 @@ class OGCRSpecChecker:
         if bbox is not None:
             if not isinstance(bbox, list) or len(bbox) != 4:
                 errors.append("bbox must be an array of 4 numbers")
-            elif not all(isinstance(x, (int, float)) for x in bbox):
+            elif not all(type(x) in BBOX_NUMBER_TYPES for x in bbox):
                 errors.append("bbox values must be numbers")
-                
-        return errors
-        
-    def _validate_ogcr_version(self, document: Dict[str, Any]) -> List[str]:
-        """Validate OGCR version format"""
-        errors = []
         
-        version = document.get('ogcr_version')
+    def _check_ogcr_version(self, version: Any, errors: List[str]):
+        """Check OGCR version format"""
         if not version:
             errors.append("Missing ogcr_version field")
         else:
             # Check semantic version format
-            if not re.match(r'^\d+\.\d+\.\d+$', version):
+            if not SEMVER_RE.match(version):
                 errors.append(f"Invalid ogcr_version format: {version} (must be semantic version)")
-                
-        return errors
-        
-    def _validate_links(self, document: Dict[str, Any]) -> List[str]:
-        """Validate links array"""
-        errors = []
         
-        links = document.get('links', [])
+    def _check_links(self, links: Any, errors: List[str]):
+        """Check the links array"""
         if links:
             # Links must be provided as an array. If the value is not a list,
             # schema validation will already flag it, but without this check we
@@ -181,7 +357,7 @@ class OGCRSpecChecker:
             # per-character errors (e.g. "Link 0 must be an object").
             if not isinstance(links, list):
                 errors.append("links must be an array of link objects")
-                return errors
+                return
 
             for i, link in enumerate(links):
                 if not isinstance(link, dict):
@@ -198,26 +374,21 @@ class OGCRSpecChecker:
                 href = link.get('href')
                 if href:
                     try:
-                        result = urlparse(href)
+                        result = cached_urlparse(href)
                         if not all([result.scheme, result.netloc]):
                             errors.append(f"Link {i} href is not a valid URL: {href}")
                     except Exception:
                         errors.append(f"Link {i} href is not a valid URL: {href}")
-                        
-        return errors
-        
-    def _validate_pdd_specific(self, document: Dict[str, Any]) -> List[str]:
-        """Validate PDD-specific requirements"""
-        errors = []
-        
-        properties = document.get('properties', {})
         
+    def _check_pdd(self, properties: Dict[str, Any], errors: List[str]):
+        """Check PDD-specific requirements"""
         # Validate creation_date format
         creation_date = properties.get('creation_date')
         if creation_date:
+            # Python 3.11+ parses a trailing 'Z' without rewriting the string
             try:
-                datetime.fromisoformat(creation_date.replace('Z', '+00:00'))
-            except ValueError:
+                datetime.fromisoformat(creation_date)
+            except (TypeError, ValueError):
                 errors.append(f"Invalid creation_date format: {creation_date}")
                 
         # Validate methodology reference
@@ -232,22 +403,16 @@ class OGCRSpecChecker:
                     errors.append("Methodology missing required 'version' field")
                     
                 version = methodology.get('version')
-                if version and not re.match(r'^\d+\.\d+(\.\d+)?$', version):
+                if version and not METHODOLOGY_VERSION_RE.match(version):
                     errors.append(f"Invalid methodology version format: {version}")
                     
         # Validate expected_annual_benefit
         benefit = properties.get('expected_annual_benefit')
         if benefit is not None and benefit < 0:
             errors.append("expected_annual_benefit must be non-negative")
-            
-        return errors
-        
-    def _validate_mrv_specific(self, document: Dict[str, Any]) -> List[str]:
-        """Validate MRV-specific requirements"""
-        errors = []
-        
-        properties = document.get('properties', {})
         
+    def _check_mrv(self, properties: Dict[str, Any], errors: List[str]):
+        """Check MRV-specific requirements"""
         # Validate date range
         start_date = properties.get('start_date')
         end_date = properties.get('end_date')
@@ -272,9 +437,8 @@ class OGCRSpecChecker:
                     errors.append("net_removal_estimate value must be non-negative")
                     
                 unit = estimate.get('unit')
-                valid_units = ['tCO2e', 'kgCO2e', 'tCO2', 'kgCO2']
-                if unit and unit not in valid_units:
-                    errors.append(f"Invalid unit: {unit} (must be one of {valid_units})")
+                if unit and (not isinstance(unit, str) or unit not in REMOVAL_UNIT_SET):
+                    errors.append(f"Invalid unit: {unit} (must be one of {list(REMOVAL_UNITS)})")
                     
         # Validate uncertainty if present
         uncertainty = properties.get('total_uncertainty')
@@ -291,37 +455,102 @@ class OGCRSpecChecker:
                     
                 if confidence is not None and not (0 <= confidence <= 1):
                     errors.append("confidence_level must be between 0 and 1")
-                    
-        return errors
         
-    def validate_file(self, file_path: str) -> Tuple[bool, List[str]]:
-        """Validate a JSON file"""
+    def validate_file(self, file_path: str, fast_fail: bool = False) -> Tuple[bool, List[str]]:
+        """
+        Validate a JSON file
+        
+        Results are stored in the cache directory, keyed by the file's path,
+        modification time and size and by the rules in force, so unchanged
+        files are not parsed or validated again.
+        """
         try:
-            with open(file_path, 'r') as f:
-                document = json.load(f)
-            return self.validate_document(document)
-        except json.JSONDecodeError as e:
-            return False, [f"Invalid JSON: {e}"]
+            with open(file_path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size,
+                       self.rules_digest, fast_fail)
+                cached = self._load_result(key)
+                if cached is not None:
+                    return cached
+                document = orjson.loads(f.read())
+            result = self.validate_document(document, fast_fail=fast_fail)
+        except orjson.JSONDecodeError as e:
+            result = False, [f"Invalid JSON: {e}"]
         except FileNotFoundError:
             return False, [f"File not found: {file_path}"]
         except Exception as e:
             return False, [f"Error reading file: {e}"]
             
+        self._store_result(key, result)
+        return result
+        
+    def _get_results_db(self):
+        """Connection to the result cache, or None if it cannot be opened"""
+        if self.results_db is None:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                db = sqlite3.connect(os.path.join(self.cache_dir, RESULTS_DB_NAME), timeout=10)
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS results ("
+                    "path TEXT, fast_fail INTEGER, mtime_ns INTEGER, size INTEGER, "
+                    "rules TEXT, valid INTEGER, errors BLOB, "
+                    "PRIMARY KEY (path, fast_fail))"
+                )
+                self.results_db = db
+            except (OSError, sqlite3.Error):
+                # Cache not usable; validate without it for this run
+                self.results_db = False
+        return self.results_db or None
+        
+    def _load_result(self, key: Tuple) -> Tuple[bool, List[str]]:
+        """Stored result for an unchanged file, or None"""
+        db = self._get_results_db()
+        if db is None:
+            return None
+        path, mtime_ns, size, rules, fast_fail = key
+        try:
+            row = db.execute(
+                "SELECT valid, errors FROM results WHERE path = ? AND fast_fail = ? "
+                "AND mtime_ns = ? AND size = ? AND rules = ?",
+                (path, fast_fail, mtime_ns, size, rules),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        return bool(row[0]), orjson.loads(row[1])
+        
+    def _store_result(self, key: Tuple, result: Tuple[bool, List[str]]):
+        """Store a file's result, replacing any from an older version of it"""
+        db = self._get_results_db()
+        if db is None:
+            return
+        valid, errors = result
+        try:
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key[0], key[4], key[1], key[2], key[3], valid, orjson.dumps(errors)),
+                )
+        except sqlite3.Error:
+            pass
+            
     def validate_api_endpoint(self, base_url: str, endpoint: str) -> Tuple[bool, List[str]]:
         """Validate an API endpoint response"""
         errors = []
         
         try:
             url = f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-            response = requests.get(url, timeout=10)
+            with self._host_slot(url):
+                response = self.session.get(url, timeout=10)
             
             if response.status_code != 200:
                 errors.append(f"HTTP {response.status_code}: {response.reason}")
                 return False, errors
                 
             try:
-                data = response.json()
-            except json.JSONDecodeError:
+                data = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
                 errors.append("Response is not valid JSON")
                 return False, errors
                 
@@ -329,23 +558,51 @@ class OGCRSpecChecker:
             if isinstance(data, dict) and data.get('type') == 'Feature':
                 return self.validate_document(data)
                 
-            # If it's a list response, validate each document
+            # If it's a list response, validate the documents in one batch
             if isinstance(data, dict) and 'data' in data:
-                all_valid = True
-                for i, item in enumerate(data['data']):
-                    if isinstance(item, dict) and item.get('type') == 'Feature':
-                        valid, item_errors = self.validate_document(item)
-                        if not valid:
-                            all_valid = False
-                            errors.extend([f"Item {i}: {err}" for err in item_errors])
-                            
-                return all_valid, errors
+                features = [
+                    (i, item) for i, item in enumerate(data['data'])
+                    if isinstance(item, dict) and item.get('type') == 'Feature'
+                ]
+                results = self.validate_documents([item for _, item in features])
+                for (i, _), (valid, item_errors) in zip(features, results):
+                    errors.extend(f"Item {i}: {err}" for err in item_errors)
+                    
+                return len(errors) == 0, errors
                 
             return True, []  # Non-document endpoints
             
         except requests.RequestException as e:
             return False, [f"Request error: {e}"]
             
+    def validate_api_endpoints(self, base_url: str, endpoints: List[str]) -> List[Tuple[bool, List[str]]]:
+        """
+        Validate several API endpoints, fetching them concurrently
+        
+        Returns:
+            List of (is_valid, list_of_errors), one per endpoint, in order
+        """
+        if not endpoints:
+            return []
+        workers = min(len(endpoints), MAX_CONCURRENT_REQUESTS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda endpoint: self.validate_api_endpoint(base_url, endpoint),
+                endpoints
+            ))
+            
+    def close(self):
+        """Close the HTTP session and the result cache"""
+        self.session.close()
+        if self.results_db:
+            self.results_db.close()
+            self.results_db = None
+            
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Semaphore limiting how many requests run against the URL's host at once"""
+        with self.host_slots_lock:
+            return self.host_slots[cached_urlparse(url).netloc]
+            
     def generate_compliance_report(self, results: List[Dict[str, Any]]) -> str:
         """Generate a compliance report from validation results"""
         report = []
@@ -371,32 +628,102 @@ class OGCRSpecChecker:
             
         return "\n".join(report)
 
+# Checker for each file validation worker process, built by its initializer
+worker_checker = None
+
+def init_file_worker(schema_dir: str, cache_dir: str):
+    """Build the worker's checker once, so schemas load once per process"""
+    global worker_checker
+    # The parent process has already reported on loading the schemas
+    with contextlib.redirect_stdout(io.StringIO()):
+        worker_checker = OGCRSpecChecker(schema_dir, cache_dir)
+    
+def validate_file_in_worker(file_path: str, fast_fail: bool) -> Tuple[bool, List[str]]:
+    """Validate a file with the worker process's checker"""
+    return worker_checker.validate_file(file_path, fast_fail=fast_fail)
+    
+def validate_files(checker: OGCRSpecChecker, file_paths: List[str],
+                   fast_fail: bool = False) -> Iterator[Tuple[bool, List[str]]]:
+    """
+    Validate several files, spread over a process pool when there are
+    multiple files and CPUs
+    
+    Yields:
+        (is_valid, list_of_errors) for each file, in order, as soon as it is ready
+        
+    The worker pool lives until the generator is exhausted or closed, so
+    callers that stop early should close it.
+    """
+    workers = min(len(file_paths), os.cpu_count() or 1)
+    if workers <= 1:
+        for file_path in file_paths:
+            yield checker.validate_file(file_path, fast_fail=fast_fail)
+        return
+        
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_file_worker,
+                             initargs=(checker.schema_dir, checker.cache_dir)) as executor:
+        yield from executor.map(validate_file_in_worker, file_paths,
+                                [fast_fail] * len(file_paths))
+
 def main():
     """Command-line interface for the spec checker"""
     parser = argparse.ArgumentParser(description="OGCR API Specification Checker")
-    parser.add_argument('--file', '-f', help="Validate a JSON file")
+    parser.add_argument('--file', '-f', action='extend', nargs='+', default=[],
+                        help="Validate JSON files (may be repeated)")
+    parser.add_argument('--expect-invalid', action='extend', nargs='+', default=[], metavar='FILE',
+                        help="JSON files that must fail validation (may be repeated)")
     parser.add_argument('--api', '-a', help="Validate API endpoint (base URL)")
     parser.add_argument('--endpoint', '-e', help="Specific endpoint to test")
     parser.add_argument('--schema-dir', '-s', help="Directory containing JSON schemas")
     parser.add_argument('--report', '-r', help="Generate compliance report to file")
     parser.add_argument('--verbose', '-v', action='store_true', help="Verbose output")
+    parser.add_argument('--fail-fast', action='store_true',
+                        help="Report only the first error of each document")
     
     args = parser.parse_args()
     
     # Initialize checker
     checker = OGCRSpecChecker(args.schema_dir)
     
-    results = []
+    # Every error is reported unless --fail-fast asks for only the first
+    fast_fail = args.fail_fast and not args.report
     
-    if args.file:
-        # Validate file
-        valid, errors = checker.validate_file(args.file)
-        results.append({
-            'name': f"File: {args.file}",
-            'valid': valid,
-            'errors': errors
-        })
-        
+    # Results are printed as they arrive; only the report keeps them all,
+    # since its summary comes first
+    report_results = []
+    failures = 0
+    
+    def emit(name: str, valid: bool, errors: List[str]):
+        nonlocal failures
+        if not valid:
+            failures += 1
+        if args.report:
+            report_results.append({'name': name, 'valid': valid, 'errors': errors})
+            return
+        status = "✓" if valid else "✗"
+        print(f"{status} {name}")
+        if not valid:
+            for error in errors:
+                print(f"  - {error}")
+                
+    if args.file or args.expect_invalid:
+        # Closing the generator shuts down its worker pool, if any
+        file_paths = args.file + args.expect_invalid
+        with contextlib.closing(validate_files(checker, file_paths, fast_fail)) as file_results:
+            for file_path in args.file:
+                valid, errors = next(file_results)
+                emit(f"File: {file_path}", valid, errors)
+                
+            for file_path in args.expect_invalid:
+                valid, errors = next(file_results)
+                name = f"File (expected invalid): {file_path}"
+                if not (os.path.isfile(file_path) and os.access(file_path, os.R_OK)):
+                    # A file that cannot be read says nothing about the document
+                    emit(name, False, errors)
+                else:
+                    emit(name, not valid,
+                         [] if not valid else ["Document passed validation but was expected to fail"])
+            
     elif args.api:
         # Validate API endpoints
         endpoints = [
@@ -407,34 +734,23 @@ def main():
         if args.endpoint:
             endpoints = [args.endpoint]
             
-        for endpoint in endpoints:
-            valid, errors = checker.validate_api_endpoint(args.api, endpoint)
-            results.append({
-                'name': f"API: {args.api}{endpoint}",
-                'valid': valid,
-                'errors': errors
-            })
+        endpoint_results = checker.validate_api_endpoints(args.api, endpoints)
+        for endpoint, (valid, errors) in zip(endpoints, endpoint_results):
+            emit(f"API: {args.api}{endpoint}", valid, errors)
     else:
         print("Please specify --file or --api option")
         sys.exit(1)
         
-    # Output results
+    checker.close()
+        
     if args.report:
-        report = checker.generate_compliance_report(results)
+        report = checker.generate_compliance_report(report_results)
         with open(args.report, 'w') as f:
             f.write(report)
         print(f"Compliance report written to {args.report}")
-    else:
-        for result in results:
-            status = "✓" if result['valid'] else "✗"
-            print(f"{status} {result['name']}")
-            
-            if not result['valid'] and (args.verbose or not args.report):
-                for error in result['errors']:
-                    print(f"  - {error}")
                     
     # Exit with error code if any validation failed
-    if any(not r['valid'] for r in results):
+    if failures:
         sys.exit(1)
 
 if __name__ == "__main__":